@@ -1,6 +1,17 @@
 import re
 from typing import Dict, List, Any
 
+# Patterns are compiled once at import so per-message calls skip the re cache lookup
+SHIPMENT_PATTERN = re.compile(r'SHP-\d{4}-\d{3,}')
+ORDER_PATTERN = re.compile(r'(?:#)?ORD-\d{3,}')
+INVOICE_PATTERN = re.compile(r'INV-\d{4}-\d{3,}')
+HS_PATTERN = re.compile(r'\b\d{4}(?:\.\d{2})?\b')
+TRACKING_PATTERN = re.compile(r'TRACK-\d{4}-\d{3,}')
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+CAPS_PATTERN = re.compile(r'\b[A-Z]{4,}\b')
+
+URGENT_WORDS = ("urgent", "asap", "immediately", "critical", "emergency", "on hold", "flagged", "violation")
+
 def extract_entities(email_body: str, email_subject: str = "") -> Dict[str, List[str]]:
     """Extract key entities from email content using regex patterns."""
     entities = {
@@ -12,30 +23,26 @@ def extract_entities(email_body: str, email_subject: str = "") -> Dict[str, List
         "tracking_refs": []
     }
     
+    text = email_body + " " + email_subject
+    
     # Shipment IDs: SHP-YYYY-NNN
-    shipment_pattern = r'SHP-\d{4}-\d{3,}'
-    entities["shipments"] = re.findall(shipment_pattern, email_body + " " + email_subject)
+    entities["shipments"] = SHIPMENT_PATTERN.findall(text)
     
     # Order IDs: ORD-NNN or #ORD-NNN
-    order_pattern = r'(?:#)?ORD-\d{3,}'
-    entities["orders"] = re.findall(order_pattern, email_body + " " + email_subject)
+    entities["orders"] = ORDER_PATTERN.findall(text)
     
     # Invoice IDs: INV-YYYY-NNN
-    invoice_pattern = r'INV-\d{4}-\d{3,}'
-    entities["invoices"] = re.findall(invoice_pattern, email_body + " " + email_subject)
+    entities["invoices"] = INVOICE_PATTERN.findall(text)
     
     # HS Codes: 4-8 digits with optional periods (XXXX.XX format)
-    hs_pattern = r'\b\d{4}(?:\.\d{2})?\b'
-    hs_matches = re.findall(hs_pattern, email_body)
+    hs_matches = HS_PATTERN.findall(email_body)
     entities["hs_codes"] = list(set(hs_matches))
     
     # Tracking references: TRACK-YYYY-NNN
-    tracking_pattern = r'TRACK-\d{4}-\d{3,}'
-    entities["tracking_refs"] = re.findall(tracking_pattern, email_body + " " + email_subject)
+    entities["tracking_refs"] = TRACKING_PATTERN.findall(text)
     
     # Customer emails (extract from body mentions)
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    entities["customers"] = re.findall(email_pattern, email_body)
+    entities["customers"] = EMAIL_PATTERN.findall(email_body)
     
     # Remove duplicates while preserving order
     for key in entities:
@@ -52,16 +59,16 @@ def extract_urgency_signals(email_body: str, email_subject: str = "") -> Dict[st
         "exclamation_marks": 0
     }
     
+    text = email_body + " " + email_subject
+    
     # Urgent keywords
-    urgent_words = ["urgent", "asap", "immediately", "critical", "emergency", "on hold", "flagged", "violation"]
-    text_lower = (email_body + " " + email_subject).lower()
-    signals["urgent_keywords"] = sum(1 for word in urgent_words if word in text_lower)
+    text_lower = text.lower()
+    signals["urgent_keywords"] = sum(1 for word in URGENT_WORDS if word in text_lower)
     
     # All-caps words (excluding short words)
-    caps_pattern = r'\b[A-Z]{4,}\b'
-    signals["all_caps_words"] = len(re.findall(caps_pattern, email_body + " " + email_subject))
+    signals["all_caps_words"] = len(CAPS_PATTERN.findall(text))
     
     # Exclamation marks
-    signals["exclamation_marks"] = (email_body + " " + email_subject).count("!")
+    signals["exclamation_marks"] = text.count("!")
     
     return signals
@@ -6,14 +6,17 @@ and generates appropriate responses and audit trails.
 """
 
 import json
+import os
 import sys
-from pathlib import Path
 
 # Import custom modules
 import extract
 import classify
 import templates
 import audit
+import reference
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 def load_json_file(filepath: str) -> dict or list:
@@ -31,6 +34,16 @@ def load_json_file(filepath: str) -> dict or list:
 
 def process_email(email: dict, orders: list, shipments: list, invoices: list) -> dict:
     """Process a single email through the entire pipeline."""
+    tables = {"orders": orders, "shipments": shipments, "invoices": invoices}
+    
+    def lookup(table: str, record_id: str):
+        return next((r for r in tables[table] if r["id"] == record_id), None)
+    
+    return process_email_with_lookup(email, lookup)
+
+
+def process_email_with_lookup(email: dict, lookup) -> dict:
+    """Process an email, resolving related records through lookup(table, record_id)."""
     
     # Extract entities
     entities = extract.extract_entities(email["body"], email["subject"])
@@ -47,16 +60,13 @@ def process_email(email: dict, orders: list, shipments: list, invoices: list) ->
     invoice_info = None
     
     if entities.get("orders"):
-        order_id = entities["orders"][0]
-        order_info = next((o for o in orders if o["id"] == order_id), None)
+        order_info = lookup("orders", entities["orders"][0])
     
     if entities.get("shipments"):
-        shipment_id = entities["shipments"][0]
-        shipment_status = next((s for s in shipments if s["id"] == shipment_id), None)
+        shipment_status = lookup("shipments", entities["shipments"][0])
     
     if entities.get("invoices"):
-        invoice_id = entities["invoices"][0]
-        invoice_info = next((i for i in invoices if i["id"] == invoice_id), None)
+        invoice_info = lookup("invoices", entities["invoices"][0])
     
     # Generate responses
     customer_response = templates.generate_customer_response(
@@ -173,8 +183,47 @@ def save_results_to_file(results: list, output_file: str = "processing_results.j
     print(f"Results saved to {output_file}")
 
 
+def process_single_email(email: dict, data_dir: str = None) -> dict:
+    """Fast-start path: process one email, loading only the reference tables it needs."""
+    # Hooks start in arbitrary directories, so default to the data shipped alongside the code
+    tables = reference.ReferenceTables(data_dir or DATA_DIR)
+    return process_email_with_lookup(email, tables.lookup)
+
+
+def run_single(source: str):
+    """Process one email read from a JSON file (or stdin for '-') and print the result."""
+    try:
+        if source == "-":
+            email = json.load(sys.stdin)
+        else:
+            with open(source, 'r') as f:
+                email = json.load(f)
+    except FileNotFoundError:
+        print(f"Error: File not found - {source}", file=sys.stderr)
+        return 1
+    except json.JSONDecodeError:
+        print(f"Error: Invalid JSON in {source}", file=sys.stderr)
+        return 1
+    
+    try:
+        result = process_single_email(email)
+    except reference.ReferenceDataError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
 def main():
     """Main application entry point."""
+    if len(sys.argv) > 1 and sys.argv[1] == "--single":
+        sys.exit(run_single(sys.argv[2] if len(sys.argv) > 2 else "-"))
+    
+    # pathlib is only needed for the batch demo, so keep it off the fast-start path
+    from pathlib import Path
+    
     print("Starting Ops Inbox AI Demo...\n")
     
     # Load data files from current directory (Demo_2)
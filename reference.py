@@ -0,0 +1,93 @@
+import json
+import marshal
+import os
+from typing import Dict, Any, Optional
+
+# Lookup tables keyed by the entity type extract.extract_entities() returns
+TABLE_FILES = {
+    "orders": "orders.json",
+    "shipments": "shipments.json",
+    "invoices": "invoices.json"
+}
+
+CACHE_DIR_NAME = ".ops_cache"
+CACHE_VERSION = 1
+
+
+class ReferenceDataError(Exception):
+    """Raised when a reference table is missing or cannot be parsed."""
+
+
+def build_index(records: list) -> Dict[str, Dict[str, Any]]:
+    """Index a reference table by record id, keeping the first record for each id."""
+    index = {}
+    for record in records:
+        index.setdefault(record["id"], record)
+    return index
+
+
+def _source_signature(source_path: str) -> tuple:
+    """Return a signature that changes whenever the source JSON file changes."""
+    stat = os.stat(source_path)
+    return (CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+
+
+def load_index(source_path: str, cache_dir: str = None) -> Dict[str, Dict[str, Any]]:
+    """Load a table index, using the on-disk marshal cache when it is still fresh."""
+    try:
+        signature = _source_signature(source_path)
+    except FileNotFoundError:
+        raise ReferenceDataError(f"File not found - {source_path}")
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(cache_dir, os.path.basename(source_path) + ".idx")
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_signature, index = marshal.load(f)
+            if cached_signature == signature:
+                return index
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+    try:
+        with open(source_path, 'r') as f:
+            index = build_index(json.load(f))
+    except json.JSONDecodeError:
+        raise ReferenceDataError(f"Invalid JSON in {source_path}")
+
+    if cache_path is not None:
+        # The cache is only an accelerator, so a read-only data dir is not an error
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                marshal.dump((signature, index), f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    return index
+
+
+class ReferenceTables:
+    """Reference data that loads each table only when a message first looks it up."""
+
+    def __init__(self, data_dir: str, use_cache: bool = True):
+        self.data_dir = data_dir
+        self.cache_dir = os.path.join(data_dir, CACHE_DIR_NAME) if use_cache else None
+        self._indexes = {}
+
+    def lookup(self, table: str, record_id: str) -> Optional[Dict[str, Any]]:
+        """Return the record with the given id from a table, or None if absent.
+
+        Raises ReferenceDataError if the table itself cannot be loaded.
+        """
+        if table not in self._indexes:
+            source_path = os.path.join(self.data_dir, TABLE_FILES[table])
+            self._indexes[table] = load_index(source_path, self.cache_dir)
+        return self._indexes[table].get(record_id)
+
+    def loaded_tables(self) -> list:
+        """Return the names of the tables loaded so far."""
+        return list(self._indexes)
@@ -0,0 +1,92 @@
+import json
+import os
+
+import pytest
+
+import reference
+
+
+def write_table(path, records):
+    with open(path, 'w') as f:
+        json.dump(records, f)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    write_table(tmp_path / "orders.json", [{"id": "ORD-1", "customer": "a@example.com"}])
+    write_table(tmp_path / "shipments.json", [{"id": "SHP-2024-001", "status": "in_transit"}])
+    write_table(tmp_path / "invoices.json", [{"id": "INV-2024-001", "amount": 10}])
+    return tmp_path
+
+
+def test_build_index_keeps_first_record_per_id():
+    index = reference.build_index([{"id": "A", "n": 1}, {"id": "A", "n": 2}, {"id": "B", "n": 3}])
+    assert index == {"A": {"id": "A", "n": 1}, "B": {"id": "B", "n": 3}}
+
+
+def test_load_index_writes_and_reuses_cache(data_dir):
+    cache_dir = str(data_dir / ".ops_cache")
+    source = str(data_dir / "orders.json")
+    assert reference.load_index(source, cache_dir) == {"ORD-1": {"id": "ORD-1", "customer": "a@example.com"}}
+    assert os.path.exists(os.path.join(cache_dir, "orders.json.idx"))
+
+    # A fresh cache is served without reparsing the source
+    stat = os.stat(source)
+    with open(source, 'w') as f:
+        f.write("x" * stat.st_size)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert "ORD-1" in reference.load_index(source, cache_dir)
+
+
+def test_load_index_rebuilds_when_source_size_changes(data_dir):
+    cache_dir = str(data_dir / ".ops_cache")
+    source = str(data_dir / "orders.json")
+    reference.load_index(source, cache_dir)
+
+    stat = os.stat(source)
+    write_table(source, [{"id": "ORD-2222"}])
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert list(reference.load_index(source, cache_dir)) == ["ORD-2222"]
+
+
+def test_load_index_rebuilds_when_source_mtime_changes(data_dir):
+    cache_dir = str(data_dir / ".ops_cache")
+    source = str(data_dir / "orders.json")
+    reference.load_index(source, cache_dir)
+
+    stat = os.stat(source)
+    write_table(source, [{"id": "ORD-2"}])
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert list(reference.load_index(source, cache_dir)) == ["ORD-2"]
+
+
+def test_load_index_recovers_from_corrupt_cache(data_dir):
+    cache_dir = data_dir / ".ops_cache"
+    cache_dir.mkdir()
+    (cache_dir / "orders.json.idx").write_bytes(b"\x00not marshal")
+    assert "ORD-1" in reference.load_index(str(data_dir / "orders.json"), str(cache_dir))
+
+
+def test_load_index_raises_for_missing_or_invalid_source(data_dir):
+    with pytest.raises(reference.ReferenceDataError):
+        reference.load_index(str(data_dir / "missing.json"))
+    (data_dir / "orders.json").write_text("{not json")
+    with pytest.raises(reference.ReferenceDataError):
+        reference.load_index(str(data_dir / "orders.json"))
+
+
+def test_reference_tables_load_only_requested_tables(data_dir):
+    tables = reference.ReferenceTables(str(data_dir))
+    assert tables.lookup("orders", "ORD-1")["customer"] == "a@example.com"
+    assert tables.lookup("orders", "ORD-404") is None
+    assert tables.loaded_tables() == ["orders"]
+
+
+def test_reference_tables_report_failed_load(data_dir):
+    os.remove(data_dir / "shipments.json")
+    tables = reference.ReferenceTables(str(data_dir), use_cache=False)
+    with pytest.raises(reference.ReferenceDataError):
+        tables.lookup("shipments", "SHP-2024-001")
+    # A failed load is not cached as an empty table
+    with pytest.raises(reference.ReferenceDataError):
+        tables.lookup("shipments", "SHP-2024-001")
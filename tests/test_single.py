@@ -0,0 +1,54 @@
+import json
+import os
+import subprocess
+import sys
+
+import main
+
+REPO_DIR = main.DATA_DIR
+
+
+def load(name):
+    with open(os.path.join(REPO_DIR, name), 'r') as f:
+        return json.load(f)
+
+
+def strip_timestamps(result):
+    for record in result["audit_trail"]:
+        record.pop("timestamp")
+        for action in record["actions"]:
+            action.pop("timestamp")
+    return result
+
+
+def test_process_single_email_matches_process_email(tmp_path):
+    orders, shipments, invoices = load("orders.json"), load("shipments.json"), load("invoices.json")
+    for email in load("inbox.json"):
+        expected = strip_timestamps(main.process_email(email, orders, shipments, invoices))
+        assert strip_timestamps(main.process_single_email(email)) == expected
+
+
+def test_single_cli_outputs_json_from_any_directory(tmp_path):
+    email = load("inbox.json")[0]
+    completed = subprocess.run(
+        [sys.executable, os.path.join(REPO_DIR, "main.py"), "--single", "-"],
+        input=json.dumps(email),
+        capture_output=True,
+        text=True,
+        cwd=str(tmp_path)
+    )
+    assert completed.returncode == 0
+    result = json.loads(completed.stdout)
+    assert result["related_data"]["order_id"] == "ORD-789"
+    assert not os.path.exists(tmp_path / ".ops_cache")
+
+
+def test_single_cli_fails_when_table_cannot_be_loaded(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(main, "DATA_DIR", str(tmp_path))
+    email_path = tmp_path / "email.json"
+    email_path.write_text(json.dumps(load("inbox.json")[0]))
+
+    assert main.run_single(str(email_path)) == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "File not found" in captured.err